@@ -0,0 +1,42 @@
+"""Numba kernels for generating mock dashboard data.
+
+Numba is optional; check NUMBA_AVAILABLE before relying on these kernels
+for speed, since without it they run as plain Python loops.
+"""
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that runs the function uncompiled, allowing uint64 wraparound"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*func_args, **func_kwargs):
+                with np.errstate(over="ignore"):
+                    return func(*func_args, **func_kwargs)
+            return wrapper
+        return decorator
+
+
+@njit(cache=True)
+def _splitmix64(x: np.uint64) -> np.uint64:
+    """Hash a 64-bit counter into a well-mixed 64-bit value"""
+    z = x + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+@njit(cache=True, parallel=True)
+def fill_uniform(out: np.ndarray, low: np.ndarray, high: np.ndarray, seed: int) -> None:
+    """Fill out[i] with an integer in [low[i], high[i]) derived from seed and i"""
+    for i in prange(out.size):
+        r = _splitmix64(np.uint64(seed) + np.uint64(i))
+        out[i] = low[i] + np.int64(r % np.uint64(high[i] - low[i]))
@@ -75,6 +75,8 @@ class NavigationButton:
 class NavigationManager:
     """Manages navigation components and state."""
     
+    _IMG_CACHE = {}
+    
     def __init__(self, parent, toggle_callback):
         self.parent = parent
         self.toggle_callback = toggle_callback
@@ -160,11 +162,13 @@ class NavigationManager:
     
     def _load_image(self, path, size):
         """Load and resize an image for use as an icon."""
-        return ctk.CTkImage(
-            light_image=Image.open(path),
-            dark_image=Image.open(path),
-            size=size
-        )
+        img = self._IMG_CACHE.get(path)
+        if img is None:
+            with Image.open(path) as src:
+                src.load()
+                img = src.copy()
+            self._IMG_CACHE[path] = img
+        return ctk.CTkImage(light_image=img, dark_image=img, size=size)
     
     def toggle(self):
         """Toggle sidebar between expanded and collapsed states."""
@@ -270,7 +274,8 @@ class App(ctk.CTk):
         self.nav_manager.add_button("assets/info.png", "Info", lambda: self.navigate_to("info"), 5)
         self.nav_manager.add_button("assets/settings.png", "Settings", lambda: self.navigate_to("settings"), 6)
         
-        self.nav_manager.load_icons()
+        # Defer icon decoding until after the first idle-time redisplay
+        self.after_idle(lambda: self.after(1, self.nav_manager.load_icons))
         self.bind("<Configure>", lambda e: self.nav_manager.update_toggle_position())
     
     def setup_screens(self):
@@ -1,5 +1,6 @@
 import customtkinter as ctk
 import datetime
+import queue
 
 class CameraFrame(ctk.CTkFrame):
     def __init__(self, master):
@@ -93,6 +94,10 @@ class CameraFrame(ctk.CTkFrame):
         self.model_loaded = False
         self.confidence_threshold = 0.5
 
+        # Latest rendered frame per feed; drained on the Tk mainloop only
+        self._frame_qs = [queue.Queue(maxsize=1) for _ in range(4)]
+        self._pump_id = None
+
         self.add_log('System initialized and ready.')
         self.add_log('Waiting for monitoring to start...')
 
@@ -100,8 +105,45 @@ class CameraFrame(ctk.CTkFrame):
         """Add log entry to the log textbox."""
         timestamp = datetime.datetime.now().strftime('%H:%M:%S')
         log_entry = f"[{timestamp}] : {message}\n"
+        # Only follow the tail if the user hasn't scrolled back through the log
+        follow = self.log_textbox.yview()[1] >= 1.0
         self.log_textbox.insert('end', log_entry)
-        self.log_textbox.see('end')
-
-    def start_monitoring(self):pass
-    def stop_monitoring(self):pass
\ No newline at end of file
+        if follow: self.log_textbox.see('end')
+
+    def push_frame(self, index, image):
+        """Queue a PIL image for feed `index`; shown while monitoring.
+
+        Safe to call from a worker thread as long as each feed has a single producer.
+        """
+        q = self._frame_qs[index]
+        try: q.put_nowait(image)
+        except queue.Full:
+            try: q.get_nowait()
+            except queue.Empty: pass
+            q.put_nowait(image)
+
+    def _pump(self):
+        """Show the newest queued frame of each feed, then reschedule while monitoring."""
+        for feed, q in zip(self.camera_feeds, self._frame_qs):
+            try: image = q.get_nowait()
+            except queue.Empty: continue
+            feed['image'] = ctk.CTkImage(light_image=image, dark_image=image,
+                                         size=(self.CAMERA_WIDTH, self.CAMERA_HEIGHT))
+            feed['label'].configure(image=feed['image'], text='')
+        self._pump_id = self.after(33, self._pump)
+
+    def start_monitoring(self):
+        if self.monitoring: return
+        self.monitoring = True
+        self.start_button.configure(state='disabled')
+        self.stop_button.configure(state='normal')
+        self._pump_id = self.after(33, self._pump)
+
+    def stop_monitoring(self):
+        if not self.monitoring: return
+        self.monitoring = False
+        self.start_button.configure(state='normal')
+        self.stop_button.configure(state='disabled')
+        if self._pump_id is not None:
+            self.after_cancel(self._pump_id)
+            self._pump_id = None
\ No newline at end of file
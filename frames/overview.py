@@ -1,13 +1,23 @@
 import customtkinter as ctk
+import tkinter as tk
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageTk
 import numpy as np
-import random
 import datetime
 from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Tuple
 
+BAR_COLORS = ("#FF5252", "#FFB142", "#20BF6B", "#3B75F2", "#9C27B0")
+
+# Fixed x positions and tick positions per time range
+_X = {"Last 24 Hours": np.arange(24), "Last Week": np.arange(7), "Last Month": np.arange(30)}
+_XTICKS = {"Last 24 Hours": np.arange(0, 24, 4), "Last Week": np.arange(7), "Last Month": np.arange(0, 30, 5)}
+for _array in (*_X.values(), *_XTICKS.values()):
+    _array.setflags(write=False)  # Shared by every caller
+
 class DataProvider(ABC):
     """Abstract base class for data providers"""
     @abstractmethod
@@ -24,46 +34,112 @@ class DataProvider(ABC):
     def get_summary_stats(self) -> Dict[str, int]:
         """Get summary statistics"""
         pass
+    
+    def refresh(self) -> None:
+        """Mark the data as stale so the next reads fetch a new snapshot"""
+        pass
 
 
 class MockDataProvider(DataProvider):
     """Mock data provider that generates larger random data"""
-    def get_time_trend_data(self, time_range: str) -> Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]:
-        """Generate larger random time trend data based on time range"""
+    _VTYPES = ("Helmet", "Vest", "Gloves", "Boots", "Mask")
+    _STAT_KEYS = ("Total Violations", "Helmet Violations", "Vest Violations", "Gloves Violations")
+    _TYPE_BOUNDS = (50000, 200001)
+    _TREND_BOUNDS = {  # size, low, high
+        "Last 24 Hours": (24, 5000, 20001),
+        "Last Week": (7, 30000, 80001),
+        "Last Month": (30, 100000, 300001)
+    }
+    
+    def __init__(self, use_numba: bool = False):
+        self._rng = np.random.default_rng()
+        
+        # Numba is slow to import, so only load the kernels when asked for
+        self._fill_uniform = None
+        if use_numba:
+            from Scripts import fast_mock
+            if fast_mock.NUMBA_AVAILABLE:
+                self._fill_uniform = fast_mock.fill_uniform
+        self._axes_cache = {}
+        self._axes_date = None
+        
+        # Struct of arrays: every series is a slice of one state vector
+        series = [("types", (len(self._VTYPES), *self._TYPE_BOUNDS)), *self._TREND_BOUNDS.items()]
+        self._slices = {}
+        low, high = [], []
+        for key, (size, lo, hi) in series:
+            self._slices[key] = slice(len(low), len(low) + size)
+            low += [lo] * size
+            high += [hi] * size
+        # Counts stay well below 2**31, so int32 halves the memory moved per draw
+        self._low = np.array(low, dtype=np.int32)
+        self._high = np.array(high, dtype=np.int32)
+        self._state = np.empty(len(low), dtype=np.int32)
+        self._dirty = True
+    
+    def refresh(self) -> None:
+        """Mark the snapshot as stale so it is redrawn on next read"""
+        self._dirty = True
+    
+    def invalidate(self) -> None:
+        """Drop cached axis data so it is rebuilt on next use"""
+        self._axes_cache.clear()
+    
+    def _axes_for(self, time_range: str) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """Get cached (x, x_labels, x_ticks) for a time range"""
+        # Weekday labels are relative to today, so rebuild when the date changes
+        today = datetime.date.today()
+        if today != self._axes_date:
+            self.invalidate()
+            self._axes_date = today
+        
+        axes = self._axes_cache.get(time_range)
+        if axes is None:
+            axes = self._axes_cache[time_range] = self._build_axes(time_range, today)
+        return axes
+    
+    def _build_axes(self, time_range: str, today: datetime.date) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """Build x values, tick labels and tick positions for a time range"""
         if time_range == "Last 24 Hours":
-            x = np.array(range(24))
-            y = np.array([random.randint(5000, 20000) for _ in range(24)])
             x_labels = [f"{h}:00" for h in range(0, 24, 4)]
-            x_ticks = np.array(range(0, 24, 4))
         elif time_range == "Last Week":
-            x = np.array(range(7))
-            y = np.array([random.randint(30000, 80000) for _ in range(7)])
-            today = datetime.datetime.now()
             x_labels = [(today - datetime.timedelta(days=6-i)).strftime("%a") for i in range(7)]
-            x_ticks = np.array(range(7))
         else:  # Last Month
-            days_in_month = 30
-            x = np.array(range(days_in_month))
-            y = np.array([random.randint(100000, 300000) for _ in range(days_in_month)])
-            x_labels = [f"{i+1}" for i in range(0, days_in_month, 5)]
-            x_ticks = np.array(range(0, days_in_month, 5))
-                
+            x_labels = [f"{i+1}" for i in range(0, 30, 5)]
+        
+        return _X.get(time_range, _X["Last Month"]), x_labels, _XTICKS.get(time_range, _XTICKS["Last Month"])
+    
+    def _snapshot(self) -> np.ndarray:
+        """Get the state vector, redrawing every series in one pass if stale"""
+        if self._dirty:
+            if self._fill_uniform is not None:
+                self._fill_uniform(self._state, self._low, self._high, int(self._rng.integers(2**63)))
+            else:
+                self._state[:] = self._rng.integers(self._low, self._high, dtype=np.int32)
+            self._dirty = False
+        return self._state
+    
+    def get_time_trend_data(self, time_range: str) -> Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]:
+        """Generate larger random time trend data based on time range
+        
+        y is a read-only view of the current snapshot; it changes after the next refresh(),
+        so copy it to keep the values.
+        """
+        x, x_labels, x_ticks = self._axes_for(time_range)
+        y = self._snapshot()[self._slices.get(time_range, self._slices["Last Month"])]
+        y.flags.writeable = False
         return x, y, x_labels, x_ticks
             
     def get_violation_types_data(self) -> Tuple[List[str], List[int]]:
         """Generate larger random violation types data"""
-        violation_types = ["Helmet", "Vest", "Gloves", "Boots", "Mask"]
-        counts = [random.randint(50000, 200000) for _ in range(len(violation_types))]
-        return violation_types, counts
+        counts = self._snapshot()[self._slices["types"]]
+        return list(self._VTYPES), counts.tolist()
             
     def get_summary_stats(self) -> Dict[str, int]:
-        """Generate larger random summary statistics"""
-        return {
-            "Total Violations": random.randint(500000, 2000000),
-            "Helmet Violations": random.randint(200000, 800000),
-            "Vest Violations": random.randint(150000, 600000),
-            "Gloves Violations": random.randint(100000, 400000)
-        }
+        """Derive summary statistics from the violation type counts"""
+        by_type = self._snapshot()[self._slices["types"]]
+        values = [int(by_type.sum()), *by_type[:3].tolist()]  # total, helmet, vest, gloves
+        return dict(zip(self._STAT_KEYS, values))
 
 class ChartComponent(ABC):
     """Base class for chart components"""
@@ -73,84 +149,198 @@ class ChartComponent(ABC):
                                       font=ctk.CTkFont(size=16, weight="bold"))
         self.title_label.pack(pady=(10, 0))
         
-        self.fig = Figure(figsize=(5, 4), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame)
-        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.fig = Figure(figsize=(5, 4), dpi=100, constrained_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        
+        # Limits are managed explicitly, so skip autoscaling as artists change
+        self.ax.set_autoscale_on(False)
+        self.ax.yaxis.set_major_formatter(StrMethodFormatter("{x:,.0f}"))
+        
+        # Render with plain Agg and show the buffer in a label; the charts are read-only
+        self.canvas = FigureCanvasAgg(self.fig)
+        width, height = self.canvas.get_width_height()
+        self._photo = ImageTk.PhotoImage("RGBA", (width, height))
+        self.image_label = tk.Label(self.frame, image=self._photo, width=width, height=height,
+                                    borderwidth=0, highlightthickness=0)
+        self.image_label.pack(fill="both", expand=True, padx=10, pady=10)
+        self.image_label.bind("<Configure>", self._on_resize)
+        self._draw_pending = None
+        
+        # Blitting state: background without the animated artists
+        self._bg = None
+        self._animated = []
+        self._grid = False
+        self._needs_full_draw = False
+        self.canvas.mpl_connect("draw_event", self._on_draw)
     
     def get_frame(self) -> ctk.CTkFrame:
         """Get the frame containing the chart"""
         return self.frame
     
+    def _add_animated(self, *artists) -> None:
+        """Register artists that are redrawn by blitting"""
+        for artist in artists:
+            artist.set_animated(True)
+            self._animated.append(artist)
+    
+    def _draw_animated(self) -> None:
+        """Draw the animated artists and gridlines onto the canvas in zorder"""
+        layers = [(artist.get_zorder(), artist) for artist in self._animated]
+        if self._grid:
+            # Gridlines sit at their axis' zorder, i.e. above bars but below lines
+            layers += [(self.ax.xaxis.get_zorder(), line) for line in self.ax.get_xgridlines()]
+            layers += [(self.ax.yaxis.get_zorder(), line) for line in self.ax.get_ygridlines()]
+        for _, artist in sorted(layers, key=lambda layer: layer[0]):
+            self.fig.draw_artist(artist)
+    
+    def _on_draw(self, event) -> None:
+        """Capture the static background after a full draw"""
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        if self._grid:
+            self.ax.grid(True)
+        self._draw_animated()
+    
+    def _on_resize(self, event) -> None:
+        """Resize the figure to the label and schedule a full redraw"""
+        if (event.width, event.height) == self.canvas.get_width_height() or min(event.width, event.height) <= 1:
+            return
+        self.fig.set_size_inches(event.width / self.fig.dpi, event.height / self.fig.dpi)
+        self._bg = None
+        self._redraw(full=True)
+    
+    def _draw_full(self) -> None:
+        """Render the whole figure and show it"""
+        self._draw_pending = None
+        if self._grid:
+            self.ax.grid(False)  # Keep the grid out of the background; it is drawn over the bars
+        self.canvas.draw()
+        self._present()
+    
+    def _present(self) -> None:
+        """Copy the Agg buffer into the label's photo image"""
+        size = self.canvas.get_width_height()
+        image = Image.frombuffer("RGBA", size, self.canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+        if (self._photo.width(), self._photo.height()) == size:
+            self._photo.paste(image)
+        else:
+            self._photo = ImageTk.PhotoImage(image)
+            self.image_label.configure(image=self._photo)
+    
+    def _fit_ylim(self, ymax: float, headroom: float) -> bool:
+        """Rescale the y axis only when the data no longer fits it well"""
+        top = self.ax.get_ylim()[1]
+        target = max(ymax * headroom, 1)  # Avoid a singular axis for all-zero data
+        if top / 2 <= target <= top:
+            return False
+        self.ax.set_ylim(0, target)
+        return True
+    
+    def _redraw(self, full: bool = False) -> None:
+        """Blit the animated artists, falling back to a full redraw when needed"""
+        if full or self._bg is None or self._draw_pending is not None:
+            if self._draw_pending is None:
+                self._draw_pending = self.image_label.after_idle(self._draw_full)
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self._present()
+    
+    def draw_idle(self) -> None:
+        """Show prepared changes, with a full draw only if the axes changed"""
+        self._redraw(self._needs_full_draw)
+        self._needs_full_draw = False
+    
     @abstractmethod
-    def update(self, *args, **kwargs) -> None:
-        """Update the chart with new data"""
+    def prepare(self, data) -> None:
+        """Apply new data to the chart artists without drawing"""
         pass
 
 class TimeTrendChart(ChartComponent):
     """Chart component for time trend visualization"""
-    def __init__(self, master: ctk.CTkFrame, data_provider: DataProvider):
-        super().__init__(master, "Violations Over Time")
-        self.data_provider = data_provider
+    INITIAL_BINS = 30
     
-    def update(self, time_range: str) -> None:
-        """Update the time trend chart based on time range"""
-        x, y, x_labels, x_ticks = self.data_provider.get_time_trend_data(time_range)
-        
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
+    def __init__(self, master: ctk.CTkFrame):
+        super().__init__(master, "Violations Over Time")
+        self._axis_key = None
         
-        # Plot the data
-        ax.bar(x, y, color="#3282B8", alpha=0.7)
-        ax.plot(x, y, color="#0F4C75", marker="o", linewidth=2)
+        # Create the artists once; updates only mutate them
+        self._bars = []
+        self._line, = self.ax.plot([], [], color="#0F4C75", marker="o", linewidth=2)
+        self._add_animated(self._line)
+        self._ensure_bars(self.INITIAL_BINS)
         
-        # Set labels and ticks
-        ax.set_xticks(x_ticks)
-        ax.set_xticklabels(x_labels)
-        ax.set_ylabel("Violations")
+        # Labels and grid
+        self.ax.set_ylabel("Violations")
+        self.ax.grid(True, linestyle="--", alpha=0.7)
+        self._grid = True
+    
+    def _ensure_bars(self, n: int) -> None:
+        """Grow the bar pool so it holds at least n bars"""
+        if n <= len(self._bars):
+            return
+        start = len(self._bars)
+        new_bars = self.ax.bar(np.arange(start, n), np.zeros(n - start), color="#3282B8", alpha=0.7)
+        self._bars.extend(new_bars)
+        self._add_animated(*new_bars)
+    
+    def prepare(self, data: Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]) -> None:
+        """Apply time trend data to the bars and line"""
+        x, y, x_labels, x_ticks = data
+        n = len(x)
         
-        # Add grid
-        ax.grid(True, linestyle="--", alpha=0.7)
+        # Reuse the first n bars and hide the rest
+        self._ensure_bars(n)
+        for i, bar in enumerate(self._bars):
+            visible = i < n
+            bar.set_visible(visible)
+            bar.set_height(y[i] if visible else 0)
+        self._line.set_data(x, y)
         
-        # Update canvas
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # Ticks and x limits only change with the time range
+        axis_key = (n, x_labels)
+        if axis_key != self._axis_key:
+            self.ax.set_xticks(x_ticks)
+            self.ax.set_xticklabels(x_labels)
+            self.ax.set_xlim(-0.5, n - 0.5)
+            self._axis_key = axis_key
+            self._needs_full_draw = True
+        self._needs_full_draw |= self._fit_ylim(y.max(), 1.05)
 
 class ViolationTypesChart(ChartComponent):
     """Chart component for violation types visualization"""
-    def __init__(self, master: ctk.CTkFrame, data_provider: DataProvider):
+    def __init__(self, master: ctk.CTkFrame):
         super().__init__(master, "Violation Types")
-        self.data_provider = data_provider
+        self._bars = None
+        self._value_labels = []
     
-    def update(self, *args, **kwargs) -> None:
-        """Update the violation types chart"""
-        violation_types, counts = self.data_provider.get_violation_types_data()
-        
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
-        
-        # Plot
-        colors = ["#FF5252", "#FFB142", "#20BF6B", "#3B75F2", "#9C27B0"]
-        bars = ax.bar(violation_types, counts, color=colors[:len(violation_types)])
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 5,
-                   f"{height}", ha="center", va="bottom")
+    def _create_artists(self, violation_types: List[str]) -> None:
+        """Create the bars and their value labels once"""
+        self._bars = self.ax.bar(violation_types, np.zeros(len(violation_types)),
+                                 color=BAR_COLORS[:len(violation_types)])
+        self._value_labels = self.ax.bar_label(self._bars, padding=3)
+        self.ax.set_xlim(-0.5, len(violation_types) - 0.5)
+        self._add_animated(*self._bars, *self._value_labels)
+        self.ax.set_ylabel("Count")
+    
+    def prepare(self, data: Tuple[List[str], List[int]]) -> None:
+        """Apply violation counts to the bars and value labels"""
+        violation_types, counts = data
+        if self._bars is None:
+            self._create_artists(violation_types)
         
-        # Labels
-        ax.set_ylabel("Count")
-        ax.set_ylim(0, max(counts) * 1.2)  # Add some space for labels
+        # Update bars and value labels in place, formatting all values at once
+        texts = np.char.mod("%d", counts).tolist()
+        for bar, label, height, text in zip(self._bars, self._value_labels, counts, texts):
+            bar.set_height(height)
+            label.xy = (label.xy[0], height)
+            label.set_text(text)
         
-        # Update canvas
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._needs_full_draw |= self._fit_ylim(max(counts), 1.2)  # Add some space for labels
 
 class SummaryStatsComponent:
     """Component for displaying summary statistics"""
-    def __init__(self, master: ctk.CTkFrame, data_provider: DataProvider):
+    def __init__(self, master: ctk.CTkFrame):
         self.frame = ctk.CTkFrame(master)
-        self.data_provider = data_provider
         
         self.title_label = ctk.CTkLabel(self.frame, text="Summary Statistics", 
                                       font=ctk.CTkFont(size=16, weight="bold"))
@@ -164,33 +354,36 @@ class SummaryStatsComponent:
         self.stat_container.grid_columnconfigure((0, 1, 2, 3), weight=1)
         self.stat_container.grid_rowconfigure(0, weight=1)
         
-        # Initialize stats boxes (will be populated in update)
+        # Stat boxes are created from the provider's keys on first update
         self.stat_boxes = {}
     
     def get_frame(self) -> ctk.CTkFrame:
         """Get the frame containing the summary stats"""
         return self.frame
     
-    def update(self, *args, **kwargs) -> None:
-        """Update the summary statistics"""
-        stats = self.data_provider.get_summary_stats()
-        
-        # Clear existing stat boxes
+    def prepare(self, stats: Dict[str, int]) -> None:
+        """Show new values in the stat boxes, rebuilding them only if the keys change"""
+        if list(stats) != list(self.stat_boxes):
+            self._create_stat_boxes(stats)
+        for title, value_label in self.stat_boxes.items():
+            value_label.configure(text=f"{stats[title]:,}")
+    
+    def _create_stat_boxes(self, titles) -> None:
+        """Replace the stat boxes with one box per title"""
         for widget in self.stat_container.winfo_children():
             widget.destroy()
         
-        # Create new stat boxes
-        colors = ["#FF5252", "#FFB142", "#20BF6B", "#3B75F2"]
-        for i, (title, value) in enumerate(stats.items()):
-            self._create_stat_box(
-                self.stat_container, 0, i, 
-                title, str(value), 
-                colors[i % len(colors)]
+        self.stat_boxes = {}
+        for i, title in enumerate(titles):
+            self.stat_boxes[title] = self._create_stat_box(
+                self.stat_container, 0, i,
+                title, "-",
+                BAR_COLORS[i % 4]
             )
     
     def _create_stat_box(self, parent: ctk.CTkFrame, row: int, col: int, 
-                         title: str, value: str, color: str) -> None:
-        """Create a statistics box with a title and value"""
+                         title: str, value: str, color: str) -> ctk.CTkLabel:
+        """Create a statistics box with a title and value, returning the value label"""
         frame = ctk.CTkFrame(parent)
         frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
         
@@ -203,12 +396,16 @@ class SummaryStatsComponent:
         # Add indicator bar
         indicator = ctk.CTkFrame(frame, height=5, fg_color=color)
         indicator.pack(fill="x", padx=10, pady=(0, 10))
+        
+        return value_label
 
 class TimeRangeSelector:
     """Component for selecting time range"""
     def __init__(self, master: ctk.CTkFrame, callback):
         self.frame = ctk.CTkFrame(master)
         self.callback = callback
+        self.debounce_ms = 80
+        self._pending = None
         
         self.time_label = ctk.CTkLabel(self.frame, text="Time Range:", font=ctk.CTkFont(size=14))
         self.time_label.grid(row=0, column=0, padx=10, pady=10)
@@ -230,8 +427,19 @@ class TimeRangeSelector:
         """Get the currently selected time range"""
         return self.time_var.get()
     
+    def set_debounce_ms(self, debounce_ms: int) -> None:
+        """Set how long to wait for further changes before notifying"""
+        self.debounce_ms = debounce_ms
+    
     def _on_time_change(self, value: str) -> None:
-        """Handle time range change event"""
+        """Handle time range change event, coalescing rapid changes"""
+        if self._pending is not None:
+            self.frame.after_cancel(self._pending)
+        self._pending = self.frame.after(self.debounce_ms, self._fire, value)
+    
+    def _fire(self, value: str) -> None:
+        """Notify the callback of the last selected time range"""
+        self._pending = None
         if self.callback:
             self.callback(value)
 
@@ -242,6 +450,10 @@ class OverviewFrame(ctk.CTkFrame):
         
         # Initialize data provider
         self.data_provider = MockDataProvider()
+        self._refresh_data = self.data_provider.refresh
+        self._fetch_trend = self.data_provider.get_time_trend_data
+        self._fetch_violations = self.data_provider.get_violation_types_data
+        self._fetch_stats = self.data_provider.get_summary_stats
         
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
@@ -259,15 +471,15 @@ class OverviewFrame(ctk.CTkFrame):
         self.time_selector.get_frame().grid(row=0, column=1, padx=20, pady=(20, 10), sticky="e")
         
         # Time trend plot
-        self.time_trend_chart = TimeTrendChart(self, self.data_provider)
+        self.time_trend_chart = TimeTrendChart(self)
         self.time_trend_chart.get_frame().grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
         
         # Violation types plot
-        self.violation_chart = ViolationTypesChart(self, self.data_provider)
+        self.violation_chart = ViolationTypesChart(self)
         self.violation_chart.get_frame().grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
         
         # Summary statistics
-        self.summary_stats = SummaryStatsComponent(self, self.data_provider)
+        self.summary_stats = SummaryStatsComponent(self)
         self.summary_stats.get_frame().grid(row=2, column=0, columnspan=2, padx=20, pady=20, sticky="nsew")
         
         # Initial update of all components
@@ -280,6 +492,18 @@ class OverviewFrame(ctk.CTkFrame):
     def _update_all_components(self) -> None:
         """Update all dashboard components"""
         time_range = self.time_selector.get_time_range()
-        self.time_trend_chart.update(time_range)
-        self.violation_chart.update()
-        self.summary_stats.update() 
\ No newline at end of file
+        self._refresh_data()
+        self._refresh(
+            self._fetch_trend(time_range),
+            self._fetch_violations(),
+            self._fetch_stats()
+        )
+    
+    def _refresh(self, trend_data, violation_data, stats) -> None:
+        """Apply one data snapshot to all components, then draw each chart once"""
+        self.time_trend_chart.prepare(trend_data)
+        self.violation_chart.prepare(violation_data)
+        self.summary_stats.prepare(stats)
+        
+        self.time_trend_chart.draw_idle()
+        self.violation_chart.draw_idle() 
\ No newline at end of file